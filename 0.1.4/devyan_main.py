@@ -11,17 +11,59 @@ import warnings
 warnings.filterwarnings("ignore")
 
 import os
+import sys
+import ast
+import json
 import time
-import datetime
+import pickle
+import shelve
+import hashlib
+import pathlib
+import shutil
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from types import MappingProxyType
+from functools import partial
 from crewai import Agent, Task, Crew, LLM
+import litellm
 from textwrap import dedent
 from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+import queue
 import re
 
+# Sanitizer patterns, compiled once at import time
+_RE_OPEN_PYTHON = re.compile(r'^[ \t]*```\s*python\s*\n', re.MULTILINE | re.IGNORECASE)
+_RE_OPEN_MARKDOWN = re.compile(r'^```\s*markdown\s*\n', re.MULTILINE | re.IGNORECASE)
+_RE_OPEN_ANY = re.compile(r'^[ \t]*```\s*\n', re.MULTILINE)
+_RE_CLOSE_LINE = re.compile(r'\n```\s*$', re.MULTILINE)
+_RE_CLOSE_END = re.compile(r'```\s*$')
+_RE_STRAY_FENCE = re.compile(r'^[ \t]*```.*$', re.MULTILINE)
+_RE_SHEBANG = re.compile(r'^#![^\n]*\n')
+_RE_BLANK_LINES = re.compile(r'\n\n\n+')
+# Any run of non-word characters or underscores; \w is Unicode-aware
+_RE_UNSAFE_NAME = re.compile(r'[\W_]+')
+
+# Use the single-pass line scanner instead of the regex passes
+FUSED_SANITIZER = True
+
+# Shared LLM clients, reused across requests so Ollama keeps the model loaded
+_SHARED_LLM = LLM(
+    model="ollama/llama3.1:8b",
+    base_url="http://localhost:11434",
+    keep_alive="30m"
+)
+# Same model in Ollama's JSON mode for single-call generation
+_SHARED_JSON_LLM = LLM(
+    model="ollama/llama3.1:8b",
+    base_url="http://localhost:11434",
+    format="json",
+    keep_alive="30m"
+)
+
 @dataclass
 class ProjectContent:
     """Container for all generated project content"""
@@ -29,16 +71,19 @@ class ProjectContent:
     code: str
     tests: str
     documentation: str
+    sanitized: bool = False
+    
+    # Minimum character counts, shared by every instance
+    MIN_LENGTHS = {
+        'architecture': 800,
+        'code': 1000,
+        'tests': 400,
+        'documentation': 600
+    }
     
     def validate(self) -> bool:
         """Validate all content meets minimum requirements"""
-        min_lengths = {
-            'architecture': 800,
-            'code': 1000,
-            'tests': 400,
-            'documentation': 600
-        }
-        
+        min_lengths = self.MIN_LENGTHS
         return (
             len(self.architecture) >= min_lengths['architecture'] and
             len(self.code) >= min_lengths['code'] and
@@ -46,6 +91,100 @@ class ProjectContent:
             len(self.documentation) >= min_lengths['documentation']
         )
 
+class LineSanitizer:
+    """Single-pass sanitizer that accepts text in chunks
+    
+    Complete lines are filtered as they arrive, so a streamed response is
+    already clean by the time the last token is received.
+    """
+    
+    def __init__(self):
+        self._lines = []
+        self._pending = ''
+        self._blank_run = 0
+        self._drained = 0
+        
+    def feed(self, chunk: str):
+        """Consume a chunk of text, processing every completed line"""
+        *complete, self._pending = (self._pending + chunk).split('\n')
+        for line in complete:
+            self._add_line(line)
+            
+    def _is_fence(self, line: str) -> bool:
+        """Whether a line is a markdown fence artifact to drop"""
+        # LLMs sometimes indent the fences along with the code
+        return line.lstrip().startswith('```')
+            
+    def _add_line(self, line: str):
+        """Drop fence lines and collapse blank runs"""
+        line = line.rstrip('\r')
+        if self._is_fence(line):
+            return
+        if line.strip():
+            self._blank_run = 0
+        else:
+            self._blank_run += 1
+            if self._blank_run > 1:
+                return
+        self._lines.append(line)
+        
+    def finish(self) -> str:
+        """Flush the last partial line and return the sanitized text"""
+        if self._pending:
+            self._add_line(self._pending)
+            self._pending = ''
+        return '\n'.join(self._lines).strip()
+    
+    def drain(self, final: bool = False) -> str:
+        """Return the text of lines completed since the last drain
+        
+        Trailing blank lines are held back until more text follows them, so
+        the drained pieces concatenate to the same stripped document.
+        """
+        if final and self._pending:
+            self._add_line(self._pending)
+            self._pending = ''
+        end = len(self._lines)
+        while end > self._drained and not self._lines[end - 1].strip():
+            end -= 1
+        if end == self._drained:
+            return ''
+        text = '\n'.join(self._lines[self._drained:end])
+        text = '\n' + text if self._drained else text.lstrip()
+        self._drained = end
+        return text
+
+class PythonLineSanitizer(LineSanitizer):
+    """Line sanitizer for Python code, dropping every fence line"""
+    
+    def finish(self) -> str:
+        """Flush the last partial line and return the sanitized code"""
+        content = super().finish()
+        if content.endswith('```'):
+            content = content[:-3].rstrip()
+        
+        # Ensure proper shebang
+        if not content.startswith('#!/usr/bin/env python'):
+            if content.startswith('#!'):
+                # Replace incorrect shebang
+                first_line = content.split('\n', 1)[0]
+                content = '#!/usr/bin/env python3' + content[len(first_line):]
+            else:
+                # Add missing shebang
+                content = ('#!/usr/bin/env python3\n' + content).strip()
+        
+        return content
+
+class MarkdownLineSanitizer(LineSanitizer):
+    """Line sanitizer for markdown, dropping ```markdown openers and bare closing fences"""
+    
+    def _is_fence(self, line: str) -> bool:
+        """Whether a line is a markdown fence artifact to drop"""
+        if not line.startswith('```'):
+            return False
+        language = line[3:].strip()
+        return not language or language.lower() == 'markdown'
+
 class OutputSanitizer:
     """Handles sanitization of LLM outputs to prevent markdown artifacts"""
     
@@ -54,29 +193,38 @@ class OutputSanitizer:
         """Remove markdown artifacts from Python code"""
         if not content:
             return content
-            
+        if not FUSED_SANITIZER:
+            return OutputSanitizer._sanitize_python_code_regex(content)
+        
+        line_sanitizer = PythonLineSanitizer()
+        line_sanitizer.feed(content)
+        return line_sanitizer.finish()
+    
+    @staticmethod
+    def _sanitize_python_code_regex(content: str) -> str:
+        """Regex-based variant of sanitize_python_code"""
         # Remove opening markdown code blocks
-        content = re.sub(r'^```\s*python\s*\n', '', content, flags=re.MULTILINE | re.IGNORECASE)
-        content = re.sub(r'^```\s*\n', '', content, flags=re.MULTILINE)
+        content = _RE_OPEN_PYTHON.sub('', content)
+        content = _RE_OPEN_ANY.sub('', content)
         
         # Remove closing markdown code blocks
-        content = re.sub(r'\n```\s*$', '', content, flags=re.MULTILINE)
-        content = re.sub(r'```\s*$', '', content)
+        content = _RE_CLOSE_LINE.sub('', content)
+        content = _RE_CLOSE_END.sub('', content)
         
         # Remove any stray triple backticks
-        content = re.sub(r'^```.*$', '', content, flags=re.MULTILINE)
+        content = _RE_STRAY_FENCE.sub('', content)
         
         # Ensure proper shebang
         if not content.startswith('#!/usr/bin/env python'):
             if content.startswith('#!'):
                 # Replace incorrect shebang
-                content = re.sub(r'^#![^\n]*\n', '#!/usr/bin/env python3\n', content)
+                content = _RE_SHEBANG.sub('#!/usr/bin/env python3\n', content)
             else:
                 # Add missing shebang
                 content = '#!/usr/bin/env python3\n' + content
         
         # Clean up excessive whitespace but preserve structure
-        content = re.sub(r'\n\n\n+', '\n\n', content)
+        content = _RE_BLANK_LINES.sub('\n\n', content)
         content = content.strip()
         
         return content
@@ -86,15 +234,24 @@ class OutputSanitizer:
         """Remove markdown code block artifacts from markdown content"""
         if not content:
             return content
-            
+        if not FUSED_SANITIZER:
+            return OutputSanitizer._sanitize_markdown_content_regex(content)
+        
+        line_sanitizer = MarkdownLineSanitizer()
+        line_sanitizer.feed(content)
+        return line_sanitizer.finish()
+    
+    @staticmethod
+    def _sanitize_markdown_content_regex(content: str) -> str:
+        """Regex-based variant of sanitize_markdown_content"""
         # Remove opening markdown code blocks that shouldn't be in markdown files
-        content = re.sub(r'^```\s*markdown\s*\n', '', content, flags=re.MULTILINE | re.IGNORECASE)
+        content = _RE_OPEN_MARKDOWN.sub('', content)
         
         # Remove stray closing code blocks
-        content = re.sub(r'\n```\s*$', '', content, flags=re.MULTILINE)
+        content = _RE_CLOSE_LINE.sub('', content)
         
         # Clean up excessive whitespace
-        content = re.sub(r'\n\n\n+', '\n\n', content)
+        content = _RE_BLANK_LINES.sub('\n\n', content)
         content = content.strip()
         
         return content
@@ -102,32 +259,788 @@ class OutputSanitizer:
     @staticmethod
     def validate_python_syntax(content: str) -> tuple[bool, str]:
         """Validate Python syntax and return status and error message"""
+        # Parsed in-process on purpose: a worker process would cost more in
+        # pickling and pipe round trips than ast.parse spends on one file
         try:
-            compile(content, '<string>', 'exec')
+            ast.parse(content)
             return True, "Valid syntax"
         except SyntaxError as e:
             return False, f"Syntax error: {e.msg} at line {e.lineno}"
         except Exception as e:
             return False, f"Compilation error: {str(e)}"
 
+class SemanticCache:
+    """Caches generated content by similarity of the user request
+    
+    Requires sentence-transformers and faiss; without them every lookup misses.
+    """
+    
+    def __init__(self, cache_dir: str, threshold: float = 0.95, max_embeddings: int = 64):
+        self.cache_dir = cache_dir
+        self.cache_file = os.path.join(cache_dir, "semantic_cache.pkl")
+        self.threshold = threshold
+        self.max_embeddings = max_embeddings
+        self._lock = threading.Lock()
+        self._enabled = None
+        self._model = None
+        self._embeddings = OrderedDict()
+        self._indexes = {}
+        self._entries = {}
+        
+    def _load(self) -> bool:
+        """Import the embedding stack and restore the cache on first use"""
+        if self._enabled is not None:
+            return self._enabled
+        try:
+            import faiss
+            import numpy as np
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            self._enabled = False
+            return False
+        
+        try:
+            self._faiss = faiss
+            self._np = np
+            # Downloads the model on first use, so this can fail offline
+            self._model = SentenceTransformer("all-MiniLM-L6-v2")
+        except Exception as e:
+            print(f"⚠️ Semantic cache disabled, embedding model unavailable: {e}")
+            self._enabled = False
+            return False
+        
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'rb') as f:
+                    stored = pickle.load(f)
+                for stage, (vectors, responses) in stored.items():
+                    self._index_for(stage).add(vectors)
+                    self._entries[stage] = (vectors, responses)
+            except Exception as e:
+                print(f"⚠️ Ignoring unreadable response cache: {e}")
+                self._indexes.clear()
+                self._entries.clear()
+        
+        self._enabled = True
+        return True
+        
+    def _index_for(self, stage: str):
+        """Return the inner-product index holding one stage's entries"""
+        if stage not in self._indexes:
+            dimension = self._model.get_sentence_embedding_dimension()
+            self._indexes[stage] = self._faiss.IndexFlatIP(dimension)
+        return self._indexes[stage]
+        
+    def _embed(self, text: str):
+        """Normalized embedding of text, so inner product is cosine similarity"""
+        # Recent requests only; the stages of one run all embed the same text
+        if text in self._embeddings:
+            self._embeddings.move_to_end(text)
+        else:
+            self._embeddings[text] = self._model.encode(
+                [text], normalize_embeddings=True
+            ).astype('float32')
+            if len(self._embeddings) > self.max_embeddings:
+                self._embeddings.popitem(last=False)
+        return self._embeddings[text]
+        
+    def get(self, stage: str, text: str) -> Optional[str]:
+        """Return the cached response for a similar request, if any"""
+        with self._lock:
+            if not self._load() or stage not in self._entries:
+                return None
+            scores, ids = self._indexes[stage].search(self._embed(text), 1)
+            if scores[0][0] < self.threshold:
+                return None
+            return self._entries[stage][1][ids[0][0]]
+        
+    def set(self, stage: str, text: str, response: str):
+        """Store a response and persist the cache to disk"""
+        with self._lock:
+            if not self._load():
+                return
+            vector = self._embed(text)
+            self._index_for(stage).add(vector)
+            vectors, responses = self._entries.get(stage, (None, []))
+            vectors = vector if vectors is None else self._np.vstack([vectors, vector])
+            self._entries[stage] = (vectors, responses + [response])
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with open(self.cache_file, 'wb') as f:
+                    pickle.dump(self._entries, f)
+            except OSError as e:
+                print(f"⚠️ Could not save response cache: {e}")
+
+class PromptCache:
+    """Exact-match cache of generated content keyed on the full prompt
+    
+    Recently used entries stay in memory; every entry persists in a shelve
+    file so repeated demos are instant across restarts.
+    """
+    
+    def __init__(self, path: str, model: str, maxsize: int = 128):
+        self.path = path
+        self.model = model
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        
+    def _key(self, stage: str, prompt: str) -> str:
+        """Hash the model, stage and prompt into a shelve key"""
+        raw = f"{self.model}\0{stage}\0{prompt}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+        
+    def _remember(self, key: str, response: str):
+        """Keep an entry in memory, evicting the least recently used"""
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+        
+    def get(self, stage: str, prompt: str) -> Optional[str]:
+        """Return the stored response for exactly this prompt, if any"""
+        key = self._key(stage, prompt)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+            try:
+                with shelve.open(self.path, flag='r') as shelf:
+                    response = shelf.get(key)
+            except Exception:
+                # No cache file yet, or an unreadable one
+                return None
+            if response is not None:
+                self._remember(key, response)
+            return response
+        
+    def set(self, stage: str, prompt: str, response: str):
+        """Store a response in memory and on disk"""
+        key = self._key(stage, prompt)
+        with self._lock:
+            self._remember(key, response)
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with shelve.open(self.path) as shelf:
+                    shelf[key] = response
+            except Exception as e:
+                print(f"⚠️ Could not save prompt cache: {e}")
+
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".devyan", "cache")
+# DEVYAN_NO_CACHE=1 generates everything fresh without reading or writing the caches
+_CACHE_DISABLED = os.environ.get("DEVYAN_NO_CACHE") == "1"
+# Stages whose output depends on the request alone; code and tests also
+# depend on the previous step, so only an exact prompt match may reuse them
+_SEMANTIC_STAGES = frozenset({'all', 'architecture', 'documentation'})
+_PROMPT_CACHE = PromptCache(os.path.join(_CACHE_DIR, "prompts"), _SHARED_LLM.model)
+_RESPONSE_CACHE = SemanticCache(_CACHE_DIR)
+
+def clear_caches():
+    """Delete the cached responses on disk; call before any generation runs"""
+    shutil.rmtree(_CACHE_DIR, ignore_errors=True)
+    print(f"🧹 Cleared response cache at {_CACHE_DIR}")
+
+# Fallback content used when the LLM is unavailable or returns unusable output
+_FALLBACK_ARCHITECTURE_TEMPLATE = dedent("""
+    # Architecture Document
+    
+    ## Project Overview
+    This project implements: {user_request}
+    
+    ## System Architecture
+    The system follows a modular architecture with clear separation of concerns:
+    - **Presentation Layer**: Handles user interface and interactions
+    - **Business Logic Layer**: Core application functionality
+    - **Data Layer**: Data management and persistence
+    
+    ## Component Design
+    ### Main Components:
+    1. **User Interface Module**
+       - Handles all user interactions
+       - Provides intuitive interface
+       - Validates user input
+    
+    2. **Core Processing Module**
+       - Implements main business logic
+       - Processes user requests
+       - Manages application state
+    
+    3. **Utility Module**
+       - Helper functions
+       - Common utilities
+       - Error handling
+    
+    ## Data Flow
+    1. User initiates action through UI
+    2. UI validates and forwards request to business logic
+    3. Business logic processes request
+    4. Results returned to UI
+    5. UI displays results to user
+    
+    ## Implementation Strategy
+    ### Phase 1: Core Functionality
+    - Implement basic features
+    - Create minimal UI
+    - Basic error handling
+    
+    ### Phase 2: Enhanced Features
+    - Add advanced functionality
+    - Improve UI/UX
+    - Comprehensive error handling
+    
+    ### Phase 3: Optimization
+    - Performance improvements
+    - Code refactoring
+    - Documentation completion
+    
+    ## Technology Stack
+    - **Language**: Python 3.8+
+    - **UI Framework**: Tkinter (for desktop) or Flask (for web)
+    - **Testing**: unittest
+    - **Documentation**: Markdown
+    
+    ## Development Phases
+    1. **Setup** (Day 1): Environment setup and project structure
+    2. **Core Development** (Days 2-3): Main functionality implementation
+    3. **Testing** (Day 4): Unit tests and integration tests
+    4. **Documentation** (Day 5): Complete documentation
+    5. **Deployment** (Day 6): Package and deploy
+    
+    ## Quality Assurance
+    - Unit testing for all components
+    - Integration testing for workflows
+    - User acceptance testing
+    - Performance benchmarking
+    """).strip()
+
+_FALLBACK_CODE_TEMPLATE = dedent("""
+    #!/usr/bin/env python3
+    \"\"\"
+    Implementation for: {user_request}
+    Generated by Devyan Direct Execution System
+    \"\"\"
+    
+    import tkinter as tk
+    from tkinter import ttk, messagebox
+    import sys
+    from typing import Optional, Callable
+    
+    class Application:
+        \"\"\"Main application class\"\"\"
+        
+        def __init__(self, master: tk.Tk):
+            self.master = master
+            self.master.title("Application")
+            self.master.geometry("600x400")
+            
+            # Configure grid
+            self.master.grid_columnconfigure(0, weight=1)
+            self.master.grid_rowconfigure(0, weight=1)
+            
+            self.setup_ui()
+            
+        def setup_ui(self):
+            \"\"\"Setup the user interface\"\"\"
+            # Main frame
+            main_frame = ttk.Frame(self.master, padding="10")
+            main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+            
+            # Title label
+            title_label = ttk.Label(
+                main_frame, 
+                text="Application Interface",
+                font=('Arial', 14, 'bold')
+            )
+            title_label.grid(row=0, column=0, columnspan=2, pady=10)
+            
+            # Input section
+            input_label = ttk.Label(main_frame, text="Input:")
+            input_label.grid(row=1, column=0, sticky=tk.W, pady=5)
+            
+            self.input_entry = ttk.Entry(main_frame, width=40)
+            self.input_entry.grid(row=1, column=1, pady=5, padx=5)
+            
+            # Buttons
+            button_frame = ttk.Frame(main_frame)
+            button_frame.grid(row=2, column=0, columnspan=2, pady=10)
+            
+            process_btn = ttk.Button(
+                button_frame,
+                text="Process",
+                command=self.process_input
+            )
+            process_btn.pack(side=tk.LEFT, padx=5)
+            
+            clear_btn = ttk.Button(
+                button_frame,
+                text="Clear",
+                command=self.clear_all
+            )
+            clear_btn.pack(side=tk.LEFT, padx=5)
+            
+            # Output section
+            output_label = ttk.Label(main_frame, text="Output:")
+            output_label.grid(row=3, column=0, sticky=tk.NW, pady=5)
+            
+            # Text widget with scrollbar
+            text_frame = ttk.Frame(main_frame)
+            text_frame.grid(row=3, column=1, pady=5, padx=5)
+            
+            self.output_text = tk.Text(
+                text_frame,
+                width=50,
+                height=10,
+                wrap=tk.WORD
+            )
+            self.output_text.pack(side=tk.LEFT)
+            
+            scrollbar = ttk.Scrollbar(
+                text_frame,
+                orient=tk.VERTICAL,
+                command=self.output_text.yview
+            )
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            self.output_text.config(yscrollcommand=scrollbar.set)
+            
+            # Status bar
+            self.status_var = tk.StringVar()
+            self.status_var.set("Ready")
+            status_bar = ttk.Label(
+                self.master,
+                textvariable=self.status_var,
+                relief=tk.SUNKEN,
+                anchor=tk.W
+            )
+            status_bar.grid(row=1, column=0, sticky=(tk.W, tk.E))
+            
+        def process_input(self):
+            \"\"\"Process the user input\"\"\"
+            user_input = self.input_entry.get().strip()
+            
+            if not user_input:
+                messagebox.showwarning("Warning", "Please enter some input")
+                return
+            
+            try:
+                # Process the input
+                result = self.perform_processing(user_input)
+                
+                # Display result
+                self.output_text.delete(1.0, tk.END)
+                self.output_text.insert(tk.END, result)
+                
+                self.status_var.set(f"Processed: {user_input}")
+                
+            except Exception as e:
+                messagebox.showerror("Error", f"Processing failed: {str(e)}")
+                self.status_var.set("Error occurred")
+                
+        def perform_processing(self, input_data: str) -> str:
+            \"\"\"
+            Perform the actual processing
+            Override this method for specific functionality
+            \"\"\"
+            # Basic processing example
+            processed = f"Processed: {input_data}\\n"
+            processed += f"Length: {len(input_data)} characters\\n"
+            processed += f"Words: {len(input_data.split())} words\\n"
+            processed += f"Uppercase: {input_data.upper()}\\n"
+            processed += f"Reversed: {input_data[::-1]}\\n"
+            
+            return processed
+            
+        def clear_all(self):
+            \"\"\"Clear all inputs and outputs\"\"\"
+            self.input_entry.delete(0, tk.END)
+            self.output_text.delete(1.0, tk.END)
+            self.status_var.set("Cleared")
+    
+    def main():
+        \"\"\"Main entry point\"\"\"
+        root = tk.Tk()
+        app = Application(root)
+        
+        # Center window on screen
+        root.update_idletasks()
+        width = root.winfo_width()
+        height = root.winfo_height()
+        x = (root.winfo_screenwidth() // 2) - (width // 2)
+        y = (root.winfo_screenheight() // 2) - (height // 2)
+        root.geometry(f'{width}x{height}+{x}+{y}')
+        
+        try:
+            root.mainloop()
+        except KeyboardInterrupt:
+            print("\\nApplication terminated by user")
+            sys.exit(0)
+    
+    if __name__ == "__main__":
+        main()
+    """).strip()
+
+_FALLBACK_TESTS_TEMPLATE = dedent("""
+    #!/usr/bin/env python3
+    \"\"\"
+    Unit tests for: {user_request}
+    Generated by Devyan Direct Execution System
+    \"\"\"
+    
+    import unittest
+    import sys
+    import os
+    from unittest.mock import Mock, patch, MagicMock
+    
+    # Add parent directory to path for imports
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    
+    # Import the module to test
+    try:
+        import main
+    except ImportError:
+        print("Warning: main.py not found, using mock")
+        main = MagicMock()
+    
+    class TestApplication(unittest.TestCase):
+        \"\"\"Test cases for the main application\"\"\"
+        
+        def setUp(self):
+            \"\"\"Set up test fixtures\"\"\"
+            self.test_input = "test data"
+            self.mock_root = MagicMock()
+            
+        def tearDown(self):
+            \"\"\"Clean up after tests\"\"\"
+            pass
+            
+        def test_initialization(self):
+            \"\"\"Test application initialization\"\"\"
+            # Test that application can be created
+            if hasattr(main, 'Application'):
+                app = main.Application(self.mock_root)
+                self.assertIsNotNone(app)
+                self.assertEqual(app.master, self.mock_root)
+            else:
+                self.skipTest("Application class not found")
+                
+        def test_input_processing(self):
+            \"\"\"Test input processing functionality\"\"\"
+            if hasattr(main, 'Application'):
+                app = main.Application(self.mock_root)
+                if hasattr(app, 'perform_processing'):
+                    result = app.perform_processing(self.test_input)
+                    self.assertIsNotNone(result)
+                    self.assertIn('test data', result.lower())
+            else:
+                self.skipTest("Processing method not found")
+                
+        def test_empty_input_handling(self):
+            \"\"\"Test handling of empty input\"\"\"
+            if hasattr(main, 'Application'):
+                app = main.Application(self.mock_root)
+                if hasattr(app, 'perform_processing'):
+                    result = app.perform_processing("")
+                    self.assertIsNotNone(result)
+            else:
+                self.skipTest("Application not testable")
+                
+        def test_special_characters(self):
+            \"\"\"Test handling of special characters\"\"\"
+            special_input = "!@#$%^&*()"
+            if hasattr(main, 'Application'):
+                app = main.Application(self.mock_root)
+                if hasattr(app, 'perform_processing'):
+                    result = app.perform_processing(special_input)
+                    self.assertIsNotNone(result)
+            else:
+                self.skipTest("Application not testable")
+                
+        def test_long_input(self):
+            \"\"\"Test handling of long input\"\"\"
+            long_input = "a" * 1000
+            if hasattr(main, 'Application'):
+                app = main.Application(self.mock_root)
+                if hasattr(app, 'perform_processing'):
+                    result = app.perform_processing(long_input)
+                    self.assertIsNotNone(result)
+                    self.assertLess(len(result), 10000)  # Result should be reasonable
+            else:
+                self.skipTest("Application not testable")
+    
+    class TestIntegration(unittest.TestCase):
+        \"\"\"Integration tests\"\"\"
+        
+        def test_end_to_end_workflow(self):
+            \"\"\"Test complete workflow\"\"\"
+            # This would test the full application flow
+            self.assertTrue(True)  # Placeholder for actual integration test
+            
+    def run_tests():
+        \"\"\"Run all tests\"\"\"
+        loader = unittest.TestLoader()
+        suite = unittest.TestSuite()
+        
+        suite.addTests(loader.loadTestsFromTestCase(TestApplication))
+        suite.addTests(loader.loadTestsFromTestCase(TestIntegration))
+        
+        runner = unittest.TextTestRunner(verbosity=2)
+        result = runner.run(suite)
+        
+        return result.wasSuccessful()
+    
+    if __name__ == "__main__":
+        success = run_tests()
+        sys.exit(0 if success else 1)
+    """).strip()
+
+_FALLBACK_DOCUMENTATION_TEMPLATE = dedent("""
+    # Project Documentation
+    
+    ## Description
+    This project implements: {user_request}
+    
+    Created using the Devyan Direct Execution System, which provides reliable AI-assisted development through psychology-independent content generation.
+    
+    ## Features
+    - ✅ Complete implementation of requested functionality
+    - ✅ Comprehensive error handling
+    - ✅ Unit test coverage
+    - ✅ Professional documentation
+    - ✅ Modular architecture
+    
+    ## Installation
+    
+    ### Prerequisites
+    - Python 3.8 or higher
+    - tkinter (usually included with Python)
+    - unittest (included with Python)
+    
+    ### Setup
+    ```bash
+    # Clone or download the project
+    git clone <repository-url>
+    cd <project-directory>
+    
+    # Install any additional dependencies
+    pip install -r requirements.txt  # if exists
+    ```
+    
+    ## Usage
+    
+    ### Running the Application
+    ```bash
+    python main.py
+    ```
+    
+    ### Basic Operations
+    1. Launch the application
+    2. Enter your input in the provided field
+    3. Click "Process" to execute
+    4. View results in the output area
+    5. Use "Clear" to reset
+    
+    ### Example
+    ```python
+    # If using as a module
+    from main import Application
+    import tkinter as tk
+    
+    root = tk.Tk()
+    app = Application(root)
+    root.mainloop()
+    ```
+    
+    ## Testing
+    
+    Run the test suite:
+    ```bash
+    python test_main.py
+    ```
+    
+    Or use unittest directly:
+    ```bash
+    python -m unittest test_main
+    ```
+    
+    ## Project Structure
+    ```
+    project/
+    ├── architecture.md    # System design document
+    ├── main.py           # Main application code
+    ├── test_main.py      # Unit tests
+    └── README.md         # This file
+    ```
+    
+    ## Architecture
+    See `architecture.md` for detailed system design and architecture decisions.
+    
+    ## Contributing
+    1. Fork the repository
+    2. Create a feature branch
+    3. Commit your changes
+    4. Push to the branch
+    5. Create a Pull Request
+    
+    ## Troubleshooting
+    
+    ### Common Issues
+    - **ImportError**: Ensure all files are in the same directory
+    - **tkinter not found**: Install python3-tk package
+    - **Tests failing**: Check that main.py exists and is valid Python
+    
+    ## License
+    MIT License - Feel free to use and modify
+    
+    ## Credits
+    Generated by Devyan Direct Execution System
+    Version 0.1.4 - Enhanced Production Release
+    """).strip()
+
 class ContentGenerator:
     """Direct content generation without agent tool usage"""
     
     def __init__(self, user_request: str):
         self.user_request = user_request
         # Use single reliable model for all generation
-        self.llm = LLM(
-            model="ollama/llama3.1:8b",
-            base_url="http://localhost:11434"
-        )
+        self.llm = _SHARED_LLM
+        self.json_llm = _SHARED_JSON_LLM
         self.sanitizer = OutputSanitizer()
+        self.prompt_cache = _PROMPT_CACHE
+        self.cache = _RESPONSE_CACHE
         
-    def generate_architecture(self) -> str:
-        """Generate architecture document directly via LLM"""
+        # Shared by every step so Ollama can reuse the cached prefix
+        self._system_prompt = dedent("""
+        You are generating one file of a software project at a time.
         
-        prompt = dedent(f"""
-        Create a comprehensive software architecture document for this request:
-        {self.user_request}
+        CRITICAL FORMATTING REQUIREMENTS:
+        - Respond with the file content ONLY, no explanations
+        - Do NOT wrap your response in markdown code blocks
+        - Do NOT include ```python or ```markdown at the beginning
+        - Do NOT include ``` at the end
+        - Python files start directly with the shebang or imports
+        - Markdown files start directly with the heading
+        - NO placeholders or TODOs
+        
+        Project request:
+        """) + self.user_request
+        
+        # generate_all asks for every file at once, so it needs its own rules
+        self._json_system_prompt = dedent("""
+        You are generating all files of a software project in one response.
+        
+        CRITICAL FORMATTING REQUIREMENTS:
+        - Respond with a single JSON object ONLY, no explanations
+        - Each field holds the complete content of one file as a string
+        - Do NOT wrap file contents in markdown code blocks
+        - Python code starts directly with the shebang or imports
+        - Markdown documents start directly with the heading
+        - NO placeholders or TODOs
+        
+        Project request:
+        """) + self.user_request
+        
+    def _lookup(self, stage: str, prompt: str, system_prompt: Optional[str] = None) -> Optional[str]:
+        """Return a cached result for a step, trying the exact prompt first"""
+        if _CACHE_DISABLED:
+            return None
+        # Keyed on the system prompt actually sent, so editing it invalidates entries
+        cached = self.prompt_cache.get(stage, (system_prompt or self._system_prompt) + prompt)
+        if cached is None and stage in _SEMANTIC_STAGES:
+            cached = self.cache.get(stage, self.user_request)
+        return cached
+        
+    def _store(self, stage: str, prompt: str, result: str, system_prompt: Optional[str] = None):
+        """Record a step's result in both caches"""
+        # A result too short to pass validation would be replayed on every
+        # later run, so only usable results are kept
+        if _CACHE_DISABLED or len(result) < ProjectContent.MIN_LENGTHS.get(stage, 0):
+            return
+        self.prompt_cache.set(stage, (system_prompt or self._system_prompt) + prompt, result)
+        if stage in _SEMANTIC_STAGES:
+            self.cache.set(stage, self.user_request, result)
+        
+    @classmethod
+    def warmup(cls):
+        """Load the model in Ollama ahead of the first real request"""
+        try:
+            _SHARED_LLM.call([{"role": "user", "content": "Reply with OK"}])
+        except Exception:
+            pass
+        
+    def _messages(self, prompt: str, system_prompt: Optional[str] = None) -> List[Dict[str, str]]:
+        """Build the chat messages for one generation step"""
+        return [
+            {"role": "system", "content": system_prompt or self._system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+        
+    def generate_all(self) -> Optional[ProjectContent]:
+        """Generate all project content in one structured JSON response"""
+        
+        prompt = dedent("""
+        Create the complete project for the project request.
+        
+        Respond with a single JSON object with exactly these string fields:
+        - "architecture": Markdown architecture document starting with "# Architecture Document",
+          covering overview, system architecture, components, data flow and technology stack
+          (at least 800 characters)
+        - "code": complete, working Python application for main.py with all imports,
+          error handling and a main execution block (at least 1000 characters)
+        - "tests": unittest test suite for that code with setUp/tearDown and at least
+          5 test cases (at least 400 characters)
+        - "documentation": README.md in Markdown with description, features, installation,
+          usage, testing and project structure sections (at least 600 characters)
+        
+        Respond with the JSON object ONLY.
+        """)
+        
+        cached = self._lookup('all', prompt, self._json_system_prompt)
+        try:
+            response = cached or self.json_llm.call(self._messages(prompt, self._json_system_prompt))
+            data = json.loads(response)
+            fields = [data[key] for key in ('architecture', 'code', 'tests', 'documentation')]
+        except (json.JSONDecodeError, TypeError, KeyError) as e:
+            print(f"⚠️ Structured response could not be parsed: {e}")
+            return None
+        except Exception as e:
+            print(f"❌ Structured generation failed: {e}")
+            return None
+        
+        if not all(isinstance(field, str) for field in fields):
+            print("⚠️ Structured response has non-text fields")
+            return None
+        
+        architecture, code, tests, documentation = fields
+        code = self._clean_code(code)
+        tests = self._clean_tests(tests)
+        if code is None or tests is None:
+            print("⚠️ Structured response has code or tests that do not parse")
+            return None
+        
+        content = ProjectContent(
+            architecture=self.sanitizer.sanitize_markdown_content(architecture),
+            code=code,
+            tests=tests,
+            documentation=self.sanitizer.sanitize_markdown_content(documentation),
+            sanitized=True
+        )
+        # Anything short of a complete project goes to the step-by-step path
+        if not content.validate():
+            print("⚠️ Structured response is too short to use")
+            return None
+        
+        if cached is None:
+            self._store('all', prompt, response, self._json_system_prompt)
+        return content
+    
+    def stream_architecture(self) -> Iterator[str]:
+        """Yield the sanitized architecture document as it is generated
+        
+        Raises if the stream breaks after text has already been yielded,
+        since the partial document cannot be replaced from in here.
+        """
+        
+        prompt = dedent("""
+        Create a comprehensive software architecture document for the project request.
         
         Your response must be a complete Markdown document with these sections:
         1. Project Overview
@@ -142,29 +1055,56 @@ class ContentGenerator:
         - Write at least 800 characters
         - Be specific and detailed
         - Include actual design decisions
-        - No placeholders or TODOs
-        - Respond with pure markdown content ONLY
-        - Do NOT wrap your response in code blocks
         
         Start your response with:
         # Architecture Document
         """)
         
+        cached = self._lookup('architecture', prompt)
+        if cached is not None:
+            yield cached
+            return
+        
+        if not FUSED_SANITIZER:
+            try:
+                response = "".join(self._stream(prompt))
+                architecture = self.sanitizer.sanitize_markdown_content(response)
+            except Exception as e:
+                yield self._fallback_architecture()
+                return
+            self._store('architecture', prompt, architecture)
+            yield architecture
+            return
+        
+        line_sanitizer = MarkdownLineSanitizer()
+        parts = []
         try:
-            response = self.llm.call([{"role": "user", "content": prompt}])
-            return self.sanitizer.sanitize_markdown_content(response)
+            for text in self._stream(prompt):
+                line_sanitizer.feed(text)
+                piece = line_sanitizer.drain()
+                if piece:
+                    parts.append(piece)
+                    yield piece
+            piece = line_sanitizer.drain(final=True)
         except Exception as e:
-            return self._fallback_architecture()
+            if parts:
+                raise
+            yield self._fallback_architecture()
+            return
+        
+        if piece:
+            parts.append(piece)
+            yield piece
+        self._store('architecture', prompt, "".join(parts))
     
     def generate_code(self, architecture: str) -> str:
         """Generate implementation code directly via LLM"""
         
         prompt = dedent(f"""
-        Create complete Python code implementing this request:
-        {self.user_request}
+        Create complete Python code implementing the project request.
         
-        Based on this architecture:
-        {architecture[:500]}...
+        Based on this architecture outline:
+        {self._outline(architecture)}
         
         Requirements:
         - Complete, working Python application
@@ -173,33 +1113,24 @@ class ContentGenerator:
         - Main execution block
         - Error handling
         - At least 1000 characters
-        - NO placeholders or TODOs
-        
-        CRITICAL FORMATTING REQUIREMENTS:
-        - Respond with PURE PYTHON CODE ONLY
-        - Do NOT wrap your response in markdown code blocks
-        - Do NOT include ```python at the beginning
-        - Do NOT include ``` at the end
-        - Start directly with the shebang or imports
         
-        Provide ONLY the Python code, no explanations or markdown formatting.
+        Respond with PURE PYTHON CODE ONLY.
         """)
         
+        cached = self._lookup('code', prompt)
+        if cached is not None:
+            return cached
+        
         try:
-            response = self.llm.call([{"role": "user", "content": prompt}])
-            sanitized = self.sanitizer.sanitize_python_code(response)
-            
-            # Validate syntax and fix if needed
-            is_valid, error_msg = self.sanitizer.validate_python_syntax(sanitized)
-            if not is_valid:
-                print(f"⚠️ Generated code has syntax issues: {error_msg}")
-                print("🔧 Using fallback code...")
-                return self._fallback_code()
-            
-            return sanitized
+            code = self._check_code(self._stream_python(prompt))
         except Exception as e:
             print(f"❌ Code generation failed: {e}")
             return self._fallback_code()
+        
+        if code is None:
+            return self._fallback_code()
+        self._store('code', prompt, code)
+        return code
     
     def generate_tests(self, code: str) -> str:
         """Generate test code directly via LLM"""
@@ -217,44 +1148,30 @@ class ContentGenerator:
         - At least 5 test cases
         - At least 400 characters
         - Executable test code
-        - NO placeholders
-        
-        CRITICAL FORMATTING REQUIREMENTS:
-        - Respond with PURE PYTHON CODE ONLY
-        - Do NOT wrap your response in markdown code blocks
-        - Do NOT include ```python at the beginning
-        - Do NOT include ``` at the end
-        - Start directly with imports
         
-        Provide ONLY the test code, no explanations.
+        Respond with PURE PYTHON CODE ONLY, starting directly with imports.
         """)
         
+        cached = self._lookup('tests', prompt)
+        if cached is not None:
+            return cached
+        
         try:
-            response = self.llm.call([{"role": "user", "content": prompt}])
-            sanitized = self.sanitizer.sanitize_python_code(response)
-            
-            # Ensure unittest import is present
-            if 'import unittest' not in sanitized:
-                sanitized = 'import unittest\n' + sanitized
-            
-            # Validate syntax
-            is_valid, error_msg = self.sanitizer.validate_python_syntax(sanitized)
-            if not is_valid:
-                print(f"⚠️ Generated tests have syntax issues: {error_msg}")
-                print("🔧 Using fallback tests...")
-                return self._fallback_tests()
-            
-            return sanitized
+            tests = self._check_tests(self._stream_python(prompt))
         except Exception as e:
             print(f"❌ Test generation failed: {e}")
             return self._fallback_tests()
+        
+        if tests is None:
+            return self._fallback_tests()
+        self._store('tests', prompt, tests)
+        return tests
     
-    def generate_documentation(self, code: str, tests: str) -> str:
+    def generate_documentation(self) -> str:
         """Generate README documentation directly via LLM"""
         
-        prompt = dedent(f"""
-        Create comprehensive README.md documentation for this project:
-        {self.user_request}
+        prompt = dedent("""
+        Create comprehensive README.md documentation for the project request.
         
         The project has these components:
         - Main code file (main.py)
@@ -275,508 +1192,178 @@ class ContentGenerator:
         - At least 600 characters
         - Markdown formatted
         - Practical examples
-        - NO placeholders
-        
-        CRITICAL FORMATTING REQUIREMENTS:
-        - Respond with pure markdown content ONLY
-        - Do NOT wrap your response in code blocks
-        - Start directly with the heading
         
         Start with:
         # Project Name
         """)
         
+        cached = self._lookup('documentation', prompt)
+        if cached is not None:
+            return cached
+        
         try:
-            response = self.llm.call([{"role": "user", "content": prompt}])
-            return self.sanitizer.sanitize_markdown_content(response)
+            response = self.llm.call(self._messages(prompt))
+            documentation = self.sanitizer.sanitize_markdown_content(response)
         except Exception as e:
             return self._fallback_documentation()
+        
+        self._store('documentation', prompt, documentation)
+        return documentation
+    
+    def finalize_documentation(self, documentation: str, tests: str) -> str:
+        """Splice the generated test case names into the README
+        
+        The README is generated in parallel with the tests, so it cannot
+        mention them itself.
+        """
+        try:
+            tree = ast.parse(tests)
+        except SyntaxError:
+            return documentation
+        
+        names = [
+            node.name for node in ast.walk(tree)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and node.name.startswith('test')
+        ]
+        if not names:
+            return documentation
+        
+        section = ["## Test Cases"] + [f"- `{name}`" for name in names] + [""]
+        lines = documentation.split('\n')
+        # Place it ahead of the closing sections, or at the end if there are none
+        for i, line in enumerate(lines):
+            if line.startswith('## ') and any(word in line for word in ('Contributing', 'License')):
+                return '\n'.join(lines[:i] + section + lines[i:])
+        return documentation + '\n\n' + '\n'.join(section).strip()
+    
+    @staticmethod
+    def _outline(architecture: str) -> str:
+        """Reduce an architecture document to its headings for use as prompt context"""
+        headings = [line for line in architecture.splitlines() if line.startswith('#')]
+        if len(headings) < 3:
+            # Not structured enough to outline, send the opening instead
+            return architecture[:500] + "..."
+        return "\n".join(headings)
+    
+    def _stream(self, prompt: str) -> Iterator[str]:
+        """Yield response text from Ollama as it is generated"""
+        response = litellm.completion(
+            model=self.llm.model,
+            api_base=self.llm.base_url,
+            messages=self._messages(prompt),
+            stream=True,
+            **self.llm.additional_params
+        )
+        for chunk in response:
+            text = chunk.choices[0].delta.content
+            if text:
+                yield text
+    
+    def _stream_python(self, prompt: str) -> str:
+        """Stream a Python response, sanitizing lines while tokens arrive"""
+        if not FUSED_SANITIZER:
+            return self.sanitizer.sanitize_python_code("".join(self._stream(prompt)))
+        
+        line_sanitizer = PythonLineSanitizer()
+        for text in self._stream(prompt):
+            line_sanitizer.feed(text)
+        return line_sanitizer.finish()
+    
+    def _clean_code(self, response: str) -> Optional[str]:
+        """Sanitize generated code, returning None if it does not parse"""
+        return self._check_code(self.sanitizer.sanitize_python_code(response))
+    
+    def _check_code(self, sanitized: str) -> Optional[str]:
+        """Validate sanitized code, returning None if it does not parse"""
+        # Validate syntax and fix if needed
+        is_valid, error_msg = self.sanitizer.validate_python_syntax(sanitized)
+        if not is_valid:
+            print(f"⚠️ Generated code has syntax issues: {error_msg}")
+            print("🔧 Using fallback code...")
+            return None
+        
+        return sanitized
+    
+    def _clean_tests(self, response: str) -> Optional[str]:
+        """Sanitize generated tests, returning None if they do not parse"""
+        return self._check_tests(self.sanitizer.sanitize_python_code(response))
+    
+    def _check_tests(self, sanitized: str) -> Optional[str]:
+        """Validate sanitized tests, returning None if they do not parse"""
+        # Ensure unittest import is present
+        if 'import unittest' not in sanitized:
+            sanitized = 'import unittest\n' + sanitized
+        
+        # Validate syntax
+        is_valid, error_msg = self.sanitizer.validate_python_syntax(sanitized)
+        if not is_valid:
+            print(f"⚠️ Generated tests have syntax issues: {error_msg}")
+            print("🔧 Using fallback tests...")
+            return None
+        
+        return sanitized
     
     def _fallback_architecture(self) -> str:
         """Fallback architecture if LLM fails"""
-        return dedent(f"""
-        # Architecture Document
-        
-        ## Project Overview
-        This project implements: {self.user_request}
-        
-        ## System Architecture
-        The system follows a modular architecture with clear separation of concerns:
-        - **Presentation Layer**: Handles user interface and interactions
-        - **Business Logic Layer**: Core application functionality
-        - **Data Layer**: Data management and persistence
-        
-        ## Component Design
-        ### Main Components:
-        1. **User Interface Module**
-           - Handles all user interactions
-           - Provides intuitive interface
-           - Validates user input
-        
-        2. **Core Processing Module**
-           - Implements main business logic
-           - Processes user requests
-           - Manages application state
-        
-        3. **Utility Module**
-           - Helper functions
-           - Common utilities
-           - Error handling
-        
-        ## Data Flow
-        1. User initiates action through UI
-        2. UI validates and forwards request to business logic
-        3. Business logic processes request
-        4. Results returned to UI
-        5. UI displays results to user
-        
-        ## Implementation Strategy
-        ### Phase 1: Core Functionality
-        - Implement basic features
-        - Create minimal UI
-        - Basic error handling
-        
-        ### Phase 2: Enhanced Features
-        - Add advanced functionality
-        - Improve UI/UX
-        - Comprehensive error handling
-        
-        ### Phase 3: Optimization
-        - Performance improvements
-        - Code refactoring
-        - Documentation completion
-        
-        ## Technology Stack
-        - **Language**: Python 3.8+
-        - **UI Framework**: Tkinter (for desktop) or Flask (for web)
-        - **Testing**: unittest
-        - **Documentation**: Markdown
-        
-        ## Development Phases
-        1. **Setup** (Day 1): Environment setup and project structure
-        2. **Core Development** (Days 2-3): Main functionality implementation
-        3. **Testing** (Day 4): Unit tests and integration tests
-        4. **Documentation** (Day 5): Complete documentation
-        5. **Deployment** (Day 6): Package and deploy
-        
-        ## Quality Assurance
-        - Unit testing for all components
-        - Integration testing for workflows
-        - User acceptance testing
-        - Performance benchmarking
-        """)
+        return _FALLBACK_ARCHITECTURE_TEMPLATE.replace("{user_request}", self.user_request)
     
     def _fallback_code(self) -> str:
         """Fallback code if LLM fails"""
-        return dedent(f"""
-        #!/usr/bin/env python3
-        \"\"\"
-        Implementation for: {self.user_request}
-        Generated by Devyan Direct Execution System
-        \"\"\"
-        
-        import tkinter as tk
-        from tkinter import ttk, messagebox
-        import sys
-        from typing import Optional, Callable
-        
-        class Application:
-            \"\"\"Main application class\"\"\"
-            
-            def __init__(self, master: tk.Tk):
-                self.master = master
-                self.master.title("Application")
-                self.master.geometry("600x400")
-                
-                # Configure grid
-                self.master.grid_columnconfigure(0, weight=1)
-                self.master.grid_rowconfigure(0, weight=1)
-                
-                self.setup_ui()
-                
-            def setup_ui(self):
-                \"\"\"Setup the user interface\"\"\"
-                # Main frame
-                main_frame = ttk.Frame(self.master, padding="10")
-                main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-                
-                # Title label
-                title_label = ttk.Label(
-                    main_frame, 
-                    text="Application Interface",
-                    font=('Arial', 14, 'bold')
-                )
-                title_label.grid(row=0, column=0, columnspan=2, pady=10)
-                
-                # Input section
-                input_label = ttk.Label(main_frame, text="Input:")
-                input_label.grid(row=1, column=0, sticky=tk.W, pady=5)
-                
-                self.input_entry = ttk.Entry(main_frame, width=40)
-                self.input_entry.grid(row=1, column=1, pady=5, padx=5)
-                
-                # Buttons
-                button_frame = ttk.Frame(main_frame)
-                button_frame.grid(row=2, column=0, columnspan=2, pady=10)
-                
-                process_btn = ttk.Button(
-                    button_frame,
-                    text="Process",
-                    command=self.process_input
-                )
-                process_btn.pack(side=tk.LEFT, padx=5)
-                
-                clear_btn = ttk.Button(
-                    button_frame,
-                    text="Clear",
-                    command=self.clear_all
-                )
-                clear_btn.pack(side=tk.LEFT, padx=5)
-                
-                # Output section
-                output_label = ttk.Label(main_frame, text="Output:")
-                output_label.grid(row=3, column=0, sticky=tk.NW, pady=5)
-                
-                # Text widget with scrollbar
-                text_frame = ttk.Frame(main_frame)
-                text_frame.grid(row=3, column=1, pady=5, padx=5)
-                
-                self.output_text = tk.Text(
-                    text_frame,
-                    width=50,
-                    height=10,
-                    wrap=tk.WORD
-                )
-                self.output_text.pack(side=tk.LEFT)
-                
-                scrollbar = ttk.Scrollbar(
-                    text_frame,
-                    orient=tk.VERTICAL,
-                    command=self.output_text.yview
-                )
-                scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-                self.output_text.config(yscrollcommand=scrollbar.set)
-                
-                # Status bar
-                self.status_var = tk.StringVar()
-                self.status_var.set("Ready")
-                status_bar = ttk.Label(
-                    self.master,
-                    textvariable=self.status_var,
-                    relief=tk.SUNKEN,
-                    anchor=tk.W
-                )
-                status_bar.grid(row=1, column=0, sticky=(tk.W, tk.E))
-                
-            def process_input(self):
-                \"\"\"Process the user input\"\"\"
-                user_input = self.input_entry.get().strip()
-                
-                if not user_input:
-                    messagebox.showwarning("Warning", "Please enter some input")
-                    return
-                
-                try:
-                    # Process the input
-                    result = self.perform_processing(user_input)
-                    
-                    # Display result
-                    self.output_text.delete(1.0, tk.END)
-                    self.output_text.insert(tk.END, result)
-                    
-                    self.status_var.set(f"Processed: {user_input}")
-                    
-                except Exception as e:
-                    messagebox.showerror("Error", f"Processing failed: {str(e)}")
-                    self.status_var.set("Error occurred")
-                    
-            def perform_processing(self, input_data: str) -> str:
-                \"\"\"
-                Perform the actual processing
-                Override this method for specific functionality
-                \"\"\"
-                # Basic processing example
-                processed = f"Processed: {input_data}\\n"
-                processed += f"Length: {len(input_data)} characters\\n"
-                processed += f"Words: {len(input_data.split())} words\\n"
-                processed += f"Uppercase: {input_data.upper()}\\n"
-                processed += f"Reversed: {input_data[::-1]}\\n"
-                
-                return processed
-                
-            def clear_all(self):
-                \"\"\"Clear all inputs and outputs\"\"\"
-                self.input_entry.delete(0, tk.END)
-                self.output_text.delete(1.0, tk.END)
-                self.status_var.set("Cleared")
-        
-        def main():
-            \"\"\"Main entry point\"\"\"
-            root = tk.Tk()
-            app = Application(root)
-            
-            # Center window on screen
-            root.update_idletasks()
-            width = root.winfo_width()
-            height = root.winfo_height()
-            x = (root.winfo_screenwidth() // 2) - (width // 2)
-            y = (root.winfo_screenheight() // 2) - (height // 2)
-            root.geometry(f'{width}x{height}+{x}+{y}')
-            
-            try:
-                root.mainloop()
-            except KeyboardInterrupt:
-                print("\\nApplication terminated by user")
-                sys.exit(0)
-        
-        if __name__ == "__main__":
-            main()
-        """)
+        return _FALLBACK_CODE_TEMPLATE.replace("{user_request}", self.user_request)
     
     def _fallback_tests(self) -> str:
         """Fallback tests if LLM fails"""
-        return dedent(f"""
-        #!/usr/bin/env python3
-        \"\"\"
-        Unit tests for: {self.user_request}
-        Generated by Devyan Direct Execution System
-        \"\"\"
-        
-        import unittest
-        import sys
-        import os
-        from unittest.mock import Mock, patch, MagicMock
-        
-        # Add parent directory to path for imports
-        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        
-        # Import the module to test
-        try:
-            import main
-        except ImportError:
-            print("Warning: main.py not found, using mock")
-            main = MagicMock()
-        
-        class TestApplication(unittest.TestCase):
-            \"\"\"Test cases for the main application\"\"\"
-            
-            def setUp(self):
-                \"\"\"Set up test fixtures\"\"\"
-                self.test_input = "test data"
-                self.mock_root = MagicMock()
-                
-            def tearDown(self):
-                \"\"\"Clean up after tests\"\"\"
-                pass
-                
-            def test_initialization(self):
-                \"\"\"Test application initialization\"\"\"
-                # Test that application can be created
-                if hasattr(main, 'Application'):
-                    app = main.Application(self.mock_root)
-                    self.assertIsNotNone(app)
-                    self.assertEqual(app.master, self.mock_root)
-                else:
-                    self.skipTest("Application class not found")
-                    
-            def test_input_processing(self):
-                \"\"\"Test input processing functionality\"\"\"
-                if hasattr(main, 'Application'):
-                    app = main.Application(self.mock_root)
-                    if hasattr(app, 'perform_processing'):
-                        result = app.perform_processing(self.test_input)
-                        self.assertIsNotNone(result)
-                        self.assertIn('test data', result.lower())
-                else:
-                    self.skipTest("Processing method not found")
-                    
-            def test_empty_input_handling(self):
-                \"\"\"Test handling of empty input\"\"\"
-                if hasattr(main, 'Application'):
-                    app = main.Application(self.mock_root)
-                    if hasattr(app, 'perform_processing'):
-                        result = app.perform_processing("")
-                        self.assertIsNotNone(result)
-                else:
-                    self.skipTest("Application not testable")
-                    
-            def test_special_characters(self):
-                \"\"\"Test handling of special characters\"\"\"
-                special_input = "!@#$%^&*()"
-                if hasattr(main, 'Application'):
-                    app = main.Application(self.mock_root)
-                    if hasattr(app, 'perform_processing'):
-                        result = app.perform_processing(special_input)
-                        self.assertIsNotNone(result)
-                else:
-                    self.skipTest("Application not testable")
-                    
-            def test_long_input(self):
-                \"\"\"Test handling of long input\"\"\"
-                long_input = "a" * 1000
-                if hasattr(main, 'Application'):
-                    app = main.Application(self.mock_root)
-                    if hasattr(app, 'perform_processing'):
-                        result = app.perform_processing(long_input)
-                        self.assertIsNotNone(result)
-                        self.assertLess(len(result), 10000)  # Result should be reasonable
-                else:
-                    self.skipTest("Application not testable")
-        
-        class TestIntegration(unittest.TestCase):
-            \"\"\"Integration tests\"\"\"
-            
-            def test_end_to_end_workflow(self):
-                \"\"\"Test complete workflow\"\"\"
-                # This would test the full application flow
-                self.assertTrue(True)  # Placeholder for actual integration test
-                
-        def run_tests():
-            \"\"\"Run all tests\"\"\"
-            loader = unittest.TestLoader()
-            suite = unittest.TestSuite()
-            
-            suite.addTests(loader.loadTestsFromTestCase(TestApplication))
-            suite.addTests(loader.loadTestsFromTestCase(TestIntegration))
-            
-            runner = unittest.TextTestRunner(verbosity=2)
-            result = runner.run(suite)
-            
-            return result.wasSuccessful()
-        
-        if __name__ == "__main__":
-            success = run_tests()
-            sys.exit(0 if success else 1)
-        """)
+        return _FALLBACK_TESTS_TEMPLATE.replace("{user_request}", self.user_request)
     
     def _fallback_documentation(self) -> str:
         """Fallback documentation if LLM fails"""
-        return dedent(f"""
-        # Project Documentation
-        
-        ## Description
-        This project implements: {self.user_request}
-        
-        Created using the Devyan Direct Execution System, which provides reliable AI-assisted development through psychology-independent content generation.
-        
-        ## Features
-        - ✅ Complete implementation of requested functionality
-        - ✅ Comprehensive error handling
-        - ✅ Unit test coverage
-        - ✅ Professional documentation
-        - ✅ Modular architecture
-        
-        ## Installation
-        
-        ### Prerequisites
-        - Python 3.8 or higher
-        - tkinter (usually included with Python)
-        - unittest (included with Python)
-        
-        ### Setup
-        ```bash
-        # Clone or download the project
-        git clone <repository-url>
-        cd <project-directory>
-        
-        # Install any additional dependencies
-        pip install -r requirements.txt  # if exists
-        ```
-        
-        ## Usage
-        
-        ### Running the Application
-        ```bash
-        python main.py
-        ```
-        
-        ### Basic Operations
-        1. Launch the application
-        2. Enter your input in the provided field
-        3. Click "Process" to execute
-        4. View results in the output area
-        5. Use "Clear" to reset
-        
-        ### Example
-        ```python
-        # If using as a module
-        from main import Application
-        import tkinter as tk
-        
-        root = tk.Tk()
-        app = Application(root)
-        root.mainloop()
-        ```
-        
-        ## Testing
-        
-        Run the test suite:
-        ```bash
-        python test_main.py
-        ```
-        
-        Or use unittest directly:
-        ```bash
-        python -m unittest test_main
-        ```
-        
-        ## Project Structure
-        ```
-        project/
-        ├── architecture.md    # System design document
-        ├── main.py           # Main application code
-        ├── test_main.py      # Unit tests
-        └── README.md         # This file
-        ```
-        
-        ## Architecture
-        See `architecture.md` for detailed system design and architecture decisions.
-        
-        ## Contributing
-        1. Fork the repository
-        2. Create a feature branch
-        3. Commit your changes
-        4. Push to the branch
-        5. Create a Pull Request
-        
-        ## Troubleshooting
-        
-        ### Common Issues
-        - **ImportError**: Ensure all files are in the same directory
-        - **tkinter not found**: Install python3-tk package
-        - **Tests failing**: Check that main.py exists and is valid Python
-        
-        ## License
-        MIT License - Feel free to use and modify
-        
-        ## Credits
-        Generated by Devyan Direct Execution System
-        Version 0.1.4 - Enhanced Production Release
-        """)
+        return _FALLBACK_DOCUMENTATION_TEMPLATE.replace("{user_request}", self.user_request)
+
+# Files every generated project is expected to contain, mapped to the
+# ProjectContent field holding each one
+EXPECTED_FILES = MappingProxyType({
+    'architecture.md': 'architecture',
+    'main.py': 'code',
+    'test_main.py': 'tests',
+    'README.md': 'documentation'
+})
 
 class DirectFileWriter:
     """Handles direct file writing without agent involvement"""
     
     def __init__(self, project_dir: str):
         self.project_dir = project_dir
-        os.makedirs(project_dir, exist_ok=True)
+        pathlib.Path(project_dir).mkdir(parents=True, exist_ok=True)
         
-    def write_all_files(self, content: ProjectContent) -> Dict[str, int]:
+    def write_all_files(self, content: ProjectContent, skip: Iterable[str] = ()) -> Dict[str, int]:
         """Write all project files directly with final validation"""
+        skip = set(skip)
         files_to_write = {
-            'architecture.md': content.architecture,
-            'main.py': content.code,
-            'test_main.py': content.tests,
-            'README.md': content.documentation
+            filename: getattr(content, field)
+            for filename, field in EXPECTED_FILES.items()
+            if filename not in skip
         }
         
+        # The files are independent, so the blocking writes can overlap
         results = {}
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                executor.submit(self._write_one, filename, file_content, content.sanitized): filename
+                for filename, file_content in files_to_write.items()
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                
+        return results
+    
+    def _write_one(self, filename: str, file_content: str, sanitized: bool) -> int:
+        """Write a single project file and return its size in bytes"""
+        file_path = os.path.join(self.project_dir, filename)
         sanitizer = OutputSanitizer()
-        
-        for filename, file_content in files_to_write.items():
-            file_path = os.path.join(self.project_dir, filename)
-            try:
-                # Final sanitization before writing
+        try:
+            # Final sanitization before writing (generator output is already clean)
+            if not sanitized:
                 if filename.endswith('.py'):
                     file_content = sanitizer.sanitize_python_code(file_content)
                     # Final syntax validation for Python files
@@ -785,17 +1372,54 @@ class DirectFileWriter:
                         print(f"⚠️ Final validation failed for {filename}: {error_msg}")
                 else:
                     file_content = sanitizer.sanitize_markdown_content(file_content)
-                
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(file_content)
-                size = len(file_content.encode('utf-8'))
-                results[filename] = size
-                print(f"✅ Written: {filename} ({size:,} bytes)")
-            except Exception as e:
-                print(f"❌ Failed to write {filename}: {e}")
-                results[filename] = 0
-                
-        return results
+            
+            # Unbuffered, so the encoded bytes go straight to write() without
+            # being copied through Python's userspace buffer first
+            data = memoryview(file_content.encode('utf-8'))
+            size = 0
+            with open(file_path, 'wb', buffering=0) as f:
+                while size < len(data):
+                    size += f.write(data[size:])
+            print(f"✅ Written: {filename} ({size:,} bytes)")
+            return size
+        except Exception as e:
+            print(f"❌ Failed to write {filename}: {e}")
+            return 0
+    
+    def stream_file(self, filename: str, chunks: Iterable[str]) -> Tuple[str, int]:
+        """Write already-sanitized chunks to a project file as they arrive
+        
+        Returns the full text, which the next generation step needs, and the
+        number of bytes written (0 if the file could not be written).
+        """
+        file_path = os.path.join(self.project_dir, filename)
+        received = bytearray()
+        try:
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        except OSError as e:
+            print(f"❌ Failed to write {filename}: {e}")
+            fd = None
+        
+        try:
+            for chunk in chunks:
+                data = memoryview(chunk.encode('utf-8'))
+                received += data
+                written = 0
+                while fd is not None and written < len(data):
+                    try:
+                        written += os.write(fd, data[written:])
+                    except OSError as e:
+                        print(f"❌ Failed to write {filename}: {e}")
+                        os.close(fd)
+                        fd = None
+        finally:
+            if fd is not None:
+                os.close(fd)
+        
+        if fd is None:
+            return received.decode('utf-8'), 0
+        print(f"✅ Written: {filename} ({len(received):,} bytes)")
+        return received.decode('utf-8'), len(received)
 
 class DirectExecutionCrew:
     """Main Direct Execution System - Psychology-Independent"""
@@ -805,7 +1429,7 @@ class DirectExecutionCrew:
         self.output_callback = output_callback
         
         # Create project directory
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         project_name = self._sanitize_name(user_request)
         self.project_dir = f"projects/direct_{project_name}_{timestamp}"
         
@@ -825,9 +1449,8 @@ class DirectExecutionCrew:
         
     def _sanitize_name(self, name: str) -> str:
         """Create safe directory name"""
-        words = name.lower().split()[:3]
-        safe_name = "_".join(word for word in words if word.isalnum())
-        return safe_name[:30] if safe_name else "project"
+        safe_name = _RE_UNSAFE_NAME.sub('_', name.lower()).strip('_')[:30].rstrip('_')
+        return safe_name or "project"
         
     def execute(self) -> bool:
         """Execute the direct generation and writing process"""
@@ -838,25 +1461,14 @@ class DirectExecutionCrew:
             self._log("\n📊 PHASE 1: Direct Content Generation")
             self._log("-" * 40)
             generator = ContentGenerator(self.user_request)
+            writer = DirectFileWriter(self.project_dir)
+            streamed = {}
             
-            self._log("📐 Generating architecture...")
-            architecture = generator.generate_architecture()
-            
-            self._log("💻 Generating code (with validation)...")
-            code = generator.generate_code(architecture)
-            
-            self._log("🧪 Generating tests (with validation)...")
-            tests = generator.generate_tests(code)
-            
-            self._log("📝 Generating documentation...")
-            documentation = generator.generate_documentation(code, tests)
-            
-            content = ProjectContent(
-                architecture=architecture,
-                code=code,
-                tests=tests,
-                documentation=documentation
-            )
+            self._log("🧩 Generating all content in one structured response...")
+            content = generator.generate_all()
+            if content is None:
+                self._log("⚠️ Structured response unusable, generating step by step")
+                content, streamed = self._generate_stepwise(generator, writer)
             
             # Validate content
             if not content.validate():
@@ -865,14 +1477,17 @@ class DirectExecutionCrew:
                     architecture=generator._fallback_architecture(),
                     code=generator._fallback_code(),
                     tests=generator._fallback_tests(),
-                    documentation=generator._fallback_documentation()
+                    documentation=generator._fallback_documentation(),
+                    sanitized=True
                 )
+                streamed = {}
             
             # Phase 2: Write all files directly with final sanitization
+            # (files streamed to disk during phase 1 are not written again)
             self._log("\n📊 PHASE 2: Direct File Writing with Validation")
             self._log("-" * 40)
-            writer = DirectFileWriter(self.project_dir)
-            write_results = writer.write_all_files(content)
+            write_results = writer.write_all_files(content, skip=streamed)
+            write_results.update(streamed)
             
             # Phase 3: Results analysis
             execution_time = time.time() - start_time
@@ -882,123 +1497,260 @@ class DirectExecutionCrew:
             self._log(f"❌ Direct execution failed: {e}")
             return False
             
+    def _generate_stepwise(self, generator: ContentGenerator,
+                           writer: DirectFileWriter) -> Tuple[ProjectContent, Dict[str, int]]:
+        """Generate content with one LLM call per file
+        
+        The architecture is written to disk while it streams in; its size is
+        returned alongside the content so phase 2 can skip it.
+        """
+        # Documentation only needs the request, so it runs alongside
+        # the architecture -> code -> tests chain instead of after it
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self._log("📐 Generating architecture...")
+            architecture_future = executor.submit(
+                writer.stream_file, 'architecture.md', generator.stream_architecture()
+            )
+            
+            self._log("📝 Generating documentation...")
+            documentation_future = executor.submit(generator.generate_documentation)
+            
+            try:
+                architecture, architecture_size = architecture_future.result()
+            except Exception as e:
+                # The partial architecture.md is rewritten with the fallback in phase 2
+                self._log(f"⚠️ Architecture stream interrupted ({e}), using fallback")
+                architecture, architecture_size = generator._fallback_architecture(), 0
+            
+            self._log("💻 Generating code (with validation)...")
+            code = generator.generate_code(architecture)
+            
+            self._log("🧪 Generating tests (with validation)...")
+            tests = generator.generate_tests(code)
+            
+            documentation = documentation_future.result()
+            
+        content = ProjectContent(
+            architecture=architecture,
+            code=code,
+            tests=tests,
+            documentation=generator.finalize_documentation(documentation, tests),
+            sanitized=True
+        )
+        # A failed stream write is retried with the other files in phase 2
+        streamed = {'architecture.md': architecture_size} if architecture_size else {}
+        return content, streamed
+    
     def _analyze_results(self, write_results: Dict[str, int], execution_time: float) -> bool:
         """Analyze and report results"""
-        self._log("\n" + "=" * 60)
-        self._log("🎯 DEVYAN v0.1.4 EXECUTION RESULTS")
-        self._log("=" * 60)
-        
-        expected_files = ['architecture.md', 'main.py', 'test_main.py', 'README.md']
-        successful_files = [f for f in expected_files if write_results.get(f, 0) > 0]
-        
-        success_rate = (len(successful_files) / len(expected_files)) * 100
-        total_size = sum(write_results.values())
-        
-        self._log(f"⏱️ Execution Time: {execution_time:.1f} seconds")
-        self._log(f"📊 Success Rate: {success_rate:.0f}% ({len(successful_files)}/{len(expected_files)} files)")
-        self._log(f"📏 Total Content: {total_size:,} bytes")
-        self._log(f"🔧 Enhanced Features: Output sanitization & validation active")
-        
-        self._log("\n📋 File Status:")
-        for filename in expected_files:
+        # One pass builds the per-file status, and the report goes out as a
+        # single log message instead of one GUI event per line
+        file_lines = []
+        successful = 0
+        for filename in EXPECTED_FILES:
             size = write_results.get(filename, 0)
+            successful += size > 0
             status = "✅" if size > 0 else "❌"
             file_type = "🐍" if filename.endswith('.py') else "📄"
-            self._log(f"   {status} {file_type} {filename}: {size:,} bytes")
+            file_lines.append(f"   {status} {file_type} {filename}: {size:,} bytes")
+        
+        success_rate = (successful / len(EXPECTED_FILES)) * 100
+        total_size = sum(write_results.values())
+        
+        lines = [
+            "\n" + "=" * 60,
+            "🎯 DEVYAN v0.1.4 EXECUTION RESULTS",
+            "=" * 60,
+            f"⏱️ Execution Time: {execution_time:.1f} seconds",
+            f"📊 Success Rate: {success_rate:.0f}% ({successful}/{len(EXPECTED_FILES)} files)",
+            f"📏 Total Content: {total_size:,} bytes",
+            f"🔧 Enhanced Features: Output sanitization & validation active",
+            "\n📋 File Status:",
+            *file_lines
+        ]
         
         if success_rate == 100:
-            self._log("\n🎉 SUCCESS: Direct Execution completed successfully!")
-            self._log("🏆 Psychology-independent approach validated")
-            self._log("🛡️ All files generated with syntax validation")
-            self._log(f"📁 Project ready at: {self.project_dir}")
+            lines += [
+                "\n🎉 SUCCESS: Direct Execution completed successfully!",
+                "🏆 Psychology-independent approach validated",
+                "🛡️ All files generated with syntax validation",
+                f"📁 Project ready at: {self.project_dir}"
+            ]
         else:
-            self._log(f"\n⚠️ Partial success: {success_rate:.0f}% files created")
-            
+            lines.append(f"\n⚠️ Partial success: {success_rate:.0f}% files created")
+        
+        self._log("\n".join(lines))
         return success_rate == 100
 
+# Demo projects offered on the demos screen
+DEMOS: Tuple[MappingProxyType, ...] = (
+    MappingProxyType({
+        "title": "📱 Calculator GUI",
+        "description": "Professional calculator app with tkinter interface, error handling, and complete test suite",
+        "complexity": "Beginner",
+        "prompt": "Create a calculator GUI with basic arithmetic operations using tkinter"
+    }),
+    MappingProxyType({
+        "title": "🌤️ Weather App",
+        "description": "Weather application with API integration, location search, and forecast display",
+        "complexity": "Intermediate",
+        "prompt": "Build a weather application that fetches data from an API and displays current conditions and forecasts"
+    }),
+    MappingProxyType({
+        "title": "📝 Todo List Manager",
+        "description": "Task management app with file persistence, categories, and due date tracking",
+        "complexity": "Beginner",
+        "prompt": "Create a todo list manager with add/remove/edit tasks, categories, and file saving"
+    }),
+    MappingProxyType({
+        "title": "🎮 Simple Game",
+        "description": "Basic 2D game with pygame, collision detection, scoring, and game states",
+        "complexity": "Intermediate",
+        "prompt": "Develop a simple 2D game using pygame with player movement, obstacles, and scoring"
+    }),
+    MappingProxyType({
+        "title": "📊 Data Visualizer",
+        "description": "Data plotting tool with matplotlib, CSV support, and interactive charts",
+        "complexity": "Intermediate",
+        "prompt": "Build a data visualization tool that reads CSV files and creates interactive charts"
+    }),
+    MappingProxyType({
+        "title": "🔍 File Organizer",
+        "description": "Utility to organize files by type, size, or date with batch operations",
+        "complexity": "Beginner",
+        "prompt": "Create a file organizer that sorts files into folders based on type, size, or date"
+    }),
+    MappingProxyType({
+        "title": "🌐 Simple Web Server",
+        "description": "Basic HTTP server with routing, static files, and API endpoints",
+        "complexity": "Advanced",
+        "prompt": "Build a simple web server with Flask that serves static files and has REST API endpoints"
+    }),
+    MappingProxyType({
+        "title": "🔐 Password Generator",
+        "description": "Secure password generator with customizable options and strength meter",
+        "complexity": "Beginner",
+        "prompt": "Create a password generator with options for length, characters, and strength checking"
+    })
+)
+
+_COMPLEXITY_COLORS = MappingProxyType({
+    "Beginner": "#28a745",
+    "Intermediate": "#ffc107",
+    "Advanced": "#dc3545"
+})
+
+# Static labels of the home screen: (text, font, foreground, top padding)
+HOME_TITLE_SPEC: Tuple[Tuple[str, tuple, str, int], ...] = (
+    ("DEVYAN", ('Arial', 36, 'bold'), '#00ff88', 0),
+    ("AI-Powered Development Assistant", ('Arial', 14), '#cccccc', 5),
+    ("v0.1.4 Production Release", ('Arial', 10), '#888888', 5),
+    ("🚀 Psychology-Independent • 🛡️ Output Validation • ✅ Syntax Guaranteed",
+     ('Arial', 11), '#00ff88', 10),
+)
+
+HOME_STATUS_SPEC: Tuple[Tuple[str, tuple, str, int], ...] = (
+    ("📡 System Status: Ready • LLM: Ollama/Llama3.1:8b • DirectExecution: Active • Validation: ON",
+     ('Arial', 9), '#888888', 0),
+    ("Built with CrewAI v0.150.0 • Psychology-Independent Architecture • Enhanced Output Validation",
+     ('Arial', 8), '#666666', 5),
+)
+
 class DevyanGUI:
     """Main GUI Application for Devyan"""
     
+    # ttk styles belong to the Tk interpreter, so configure them once per root
+    _styled_root: Optional[tk.Misc] = None
+    
     def __init__(self, master):
         self.master = master
         self.master.title("Devyan - AI Development Assistant v0.1.4")
         self.master.geometry("800x600")
         self.master.configure(bg='#1e1e1e')
         
-        # Configure style
-        self.style = ttk.Style()
-        self.style.theme_use('clam')
+        self._init_styles(master)
         
-        # Configure dark theme colors
-        self.style.configure('Title.TLabel', 
-                           foreground='#00ff88', 
-                           background='#1e1e1e',
-                           font=('Arial', 24, 'bold'))
-        
-        self.style.configure('Subtitle.TLabel', 
-                           foreground='#ffffff', 
-                           background='#1e1e1e',
-                           font=('Arial', 12))
-        
-        self.style.configure('Demo.TButton',
-                           foreground='#ffffff',
-                           background='#3366cc',
-                           font=('Arial', 12),
-                           padding=10)
-        
-        self.style.configure('Main.TButton',
-                           foreground='#ffffff',
-                           background='#00ff88',
-                           font=('Arial', 14, 'bold'),
-                           padding=15)
+        # Load the model in the background so the first request starts warm
+        threading.Thread(target=ContentGenerator.warmup, daemon=True).start()
+        
+        # Worker threads queue output; the Tk thread flushes it in batches,
+        # so the read-only output widget is unlocked once per batch
+        self._log_queue = queue.Queue()
+        self._drain_log()
+        
+        # Build every screen once; navigation only swaps which one is packed
+        self._current_frame = None
+        self._home_frame = self._build_home_screen()
+        self._demos_frame = self._build_demos_screen()
+        self._prompt_frame = self._build_prompt_screen()
         
         self.setup_home_screen()
         
+    @classmethod
+    def _init_styles(cls, root: tk.Misc):
+        """Configure the dark theme styles, at most once per Tk root"""
+        if cls._styled_root is root:
+            return
+        
+        style = ttk.Style(root)
+        style.theme_use('clam')
+        
+        # Configure dark theme colors
+        style.configure('Title.TLabel', 
+                      foreground='#00ff88', 
+                      background='#1e1e1e',
+                      font=('Arial', 24, 'bold'))
+        
+        style.configure('Subtitle.TLabel', 
+                      foreground='#ffffff', 
+                      background='#1e1e1e',
+                      font=('Arial', 12))
+        
+        style.configure('Demo.TButton',
+                      foreground='#ffffff',
+                      background='#3366cc',
+                      font=('Arial', 12),
+                      padding=10)
+        
+        style.configure('Main.TButton',
+                      foreground='#ffffff',
+                      background='#00ff88',
+                      font=('Arial', 14, 'bold'),
+                      padding=15)
+        
+        cls._styled_root = root
+        
+    def _show(self, frame: tk.Frame):
+        """Replace the visible screen with the given prebuilt one"""
+        if self._current_frame is frame:
+            return
+        if self._current_frame is not None:
+            self._current_frame.pack_forget()
+        frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        self._current_frame = frame
+        
     def setup_home_screen(self):
-        """Setup the main home screen"""
-        # Clear existing widgets
-        for widget in self.master.winfo_children():
-            widget.destroy()
-            
+        """Show the main home screen"""
+        self._show(self._home_frame)
+    
+    def show_demos(self):
+        """Show demo options screen"""
+        self._show(self._demos_frame)
+    
+    def show_prompt_interface(self):
+        """Show the prompt input interface"""
+        self._show(self._prompt_frame)
+        
+    def _build_home_screen(self) -> tk.Frame:
+        """Build the main home screen"""
         # Main container
         main_frame = tk.Frame(self.master, bg='#1e1e1e')
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Title section with cool styling
         title_frame = tk.Frame(main_frame, bg='#1e1e1e')
         title_frame.pack(pady=(0, 30))
         
-        # Main title with gradient-like effect
-        title_label = tk.Label(title_frame, 
-                              text="DEVYAN", 
-                              font=('Arial', 36, 'bold'),
-                              fg='#00ff88',
-                              bg='#1e1e1e')
-        title_label.pack()
-        
-        # Subtitle
-        subtitle_label = tk.Label(title_frame,
-                                 text="AI-Powered Development Assistant",
-                                 font=('Arial', 14),
-                                 fg='#cccccc',
-                                 bg='#1e1e1e')
-        subtitle_label.pack(pady=(5, 0))
-        
-        # Version label
-        version_label = tk.Label(title_frame,
-                                text="v0.1.4 Production Release",
-                                font=('Arial', 10),
-                                fg='#888888',
-                                bg='#1e1e1e')
-        version_label.pack(pady=(5, 0))
-        
-        # Feature highlight
-        feature_label = tk.Label(title_frame,
-                                text="🚀 Psychology-Independent • 🛡️ Output Validation • ✅ Syntax Guaranteed",
-                                font=('Arial', 11),
-                                fg='#00ff88',
-                                bg='#1e1e1e')
-        feature_label.pack(pady=(10, 0))
+        self._build_from_spec(title_frame, HOME_TITLE_SPEC)
         
         # Options frame
         options_frame = tk.Frame(main_frame, bg='#1e1e1e')
@@ -1038,31 +1790,20 @@ class DevyanGUI:
         status_frame = tk.Frame(main_frame, bg='#1e1e1e')
         status_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(30, 0))
         
-        # System status
-        status_label = tk.Label(status_frame,
-                               text="📡 System Status: Ready • LLM: Ollama/Llama3.1:8b • DirectExecution: Active • Validation: ON",
-                               font=('Arial', 9),
-                               fg='#888888',
-                               bg='#1e1e1e')
-        status_label.pack()
+        self._build_from_spec(status_frame, HOME_STATUS_SPEC)
         
-        # Credits
-        credits_label = tk.Label(status_frame,
-                                text="Built with CrewAI v0.150.0 • Psychology-Independent Architecture • Enhanced Output Validation",
-                                font=('Arial', 8),
-                                fg='#666666',
-                                bg='#1e1e1e')
-        credits_label.pack(pady=(5, 0))
+        return main_frame
     
-    def show_demos(self):
-        """Show demo options screen"""
-        # Clear existing widgets
-        for widget in self.master.winfo_children():
-            widget.destroy()
-            
+    @staticmethod
+    def _build_from_spec(parent: tk.Frame, spec: Tuple[Tuple[str, tuple, str, int], ...]):
+        """Pack a column of static labels described by a spec tuple"""
+        for text, font, fg, top in spec:
+            tk.Label(parent, text=text, font=font, fg=fg, bg='#1e1e1e').pack(pady=(top, 0))
+    
+    def _build_demos_screen(self) -> tk.Frame:
+        """Build the demo options screen"""
         # Main container
         main_frame = tk.Frame(self.master, bg='#1e1e1e')
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Header
         header_frame = tk.Frame(main_frame, bg='#1e1e1e')
@@ -1105,59 +1846,7 @@ class DevyanGUI:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Demo projects
-        demos = [
-            {
-                "title": "📱 Calculator GUI",
-                "description": "Professional calculator app with tkinter interface, error handling, and complete test suite",
-                "complexity": "Beginner",
-                "prompt": "Create a calculator GUI with basic arithmetic operations using tkinter"
-            },
-            {
-                "title": "🌤️ Weather App",
-                "description": "Weather application with API integration, location search, and forecast display",
-                "complexity": "Intermediate",
-                "prompt": "Build a weather application that fetches data from an API and displays current conditions and forecasts"
-            },
-            {
-                "title": "📝 Todo List Manager",
-                "description": "Task management app with file persistence, categories, and due date tracking",
-                "complexity": "Beginner",
-                "prompt": "Create a todo list manager with add/remove/edit tasks, categories, and file saving"
-            },
-            {
-                "title": "🎮 Simple Game",
-                "description": "Basic 2D game with pygame, collision detection, scoring, and game states",
-                "complexity": "Intermediate",
-                "prompt": "Develop a simple 2D game using pygame with player movement, obstacles, and scoring"
-            },
-            {
-                "title": "📊 Data Visualizer",
-                "description": "Data plotting tool with matplotlib, CSV support, and interactive charts",
-                "complexity": "Intermediate",
-                "prompt": "Build a data visualization tool that reads CSV files and creates interactive charts"
-            },
-            {
-                "title": "🔍 File Organizer",
-                "description": "Utility to organize files by type, size, or date with batch operations",
-                "complexity": "Beginner",
-                "prompt": "Create a file organizer that sorts files into folders based on type, size, or date"
-            },
-            {
-                "title": "🌐 Simple Web Server",
-                "description": "Basic HTTP server with routing, static files, and API endpoints",
-                "complexity": "Advanced",
-                "prompt": "Build a simple web server with Flask that serves static files and has REST API endpoints"
-            },
-            {
-                "title": "🔐 Password Generator",
-                "description": "Secure password generator with customizable options and strength meter",
-                "complexity": "Beginner",
-                "prompt": "Create a password generator with options for length, characters, and strength checking"
-            }
-        ]
-        
-        for i, demo in enumerate(demos):
+        for i, demo in enumerate(DEMOS):
             demo_frame = tk.Frame(scrollable_frame, bg='#2a2a2a', relief='raised', bd=1)
             demo_frame.pack(fill=tk.X, pady=5, padx=10)
             
@@ -1177,17 +1866,11 @@ class DevyanGUI:
             title_label.pack(side=tk.LEFT)
             
             # Complexity badge
-            complexity_colors = {
-                "Beginner": "#28a745",
-                "Intermediate": "#ffc107", 
-                "Advanced": "#dc3545"
-            }
-            
             complexity_label = tk.Label(title_frame,
                                        text=demo["complexity"],
                                        font=('Arial', 9, 'bold'),
                                        fg='#ffffff',
-                                       bg=complexity_colors.get(demo["complexity"], "#666666"),
+                                       bg=_COMPLEXITY_COLORS.get(demo["complexity"], "#666666"),
                                        padx=8,
                                        pady=2)
             complexity_label.pack(side=tk.RIGHT)
@@ -1212,22 +1895,19 @@ class DevyanGUI:
                                   padx=20,
                                   pady=8,
                                   cursor='hand2',
-                                  command=lambda p=demo["prompt"]: self.run_demo(p))
+                                  command=partial(self.run_demo, demo["prompt"]))
             run_button.pack(side=tk.LEFT)
         
         # Pack scrollable components
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
+        
+        return main_frame
     
-    def show_prompt_interface(self):
-        """Show the prompt input interface"""
-        # Clear existing widgets
-        for widget in self.master.winfo_children():
-            widget.destroy()
-            
+    def _build_prompt_screen(self) -> tk.Frame:
+        """Build the prompt input interface"""
         # Main container
         main_frame = tk.Frame(self.master, bg='#1e1e1e')
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Header
         header_frame = tk.Frame(main_frame, bg='#1e1e1e')
@@ -1344,6 +2024,8 @@ class DevyanGUI:
                                                      insertbackground='#ffffff',
                                                      state='disabled')
         self.output_text.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+        
+        return main_frame
     
     def run_demo(self, prompt: str):
         """Run a demo with the given prompt"""
@@ -1369,9 +2051,7 @@ class DevyanGUI:
         self.output_text.delete(1.0, tk.END)
         self.output_text.config(state='disabled')
         
-        def output_callback(message):
-            """Callback to update output text"""
-            self.master.after(0, lambda: self._update_output(message))
+        output_callback = self._log_queue.put
         
         def run_execution():
             """Run the execution in a separate thread"""
@@ -1394,6 +2074,21 @@ class DevyanGUI:
         # Start execution in background thread
         threading.Thread(target=run_execution, daemon=True).start()
     
+    def _drain_log(self):
+        """Flush queued output messages to the output widget in one insert"""
+        output_text = getattr(self, 'output_text', None)
+        if output_text is not None and output_text.winfo_exists():
+            messages = []
+            try:
+                while len(messages) < 500:
+                    messages.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                pass
+            if messages:
+                self._update_output("\n".join(messages))
+        
+        self.master.after(50, self._drain_log)
+    
     def _update_output(self, message: str):
         """Update the output text widget"""
         self.output_text.config(state='normal')
@@ -1403,6 +2098,9 @@ class DevyanGUI:
 
 def main():
     """Main entry point"""
+    if "--clear-cache" in sys.argv[1:]:
+        clear_caches()
+    
     root = tk.Tk()
     
     # Set window icon and properties
@@ -1429,5 +2127,4 @@ def main():
     return 0
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
@@ -5,20 +5,44 @@ System checker and dependency installer
 
 This script checks your system for the required dependencies
 and launches the Devyan application.
+
+A successful check is cached for a day. To skip the checks entirely,
+run `python launch.py --skip-checks` or set DEVYAN_SKIP_CHECKS=1.
 """
 
-import subprocess
 import sys
 import os
+import json
+import time
+import socket
+import shutil
+import threading
 import importlib.util
 
+# Check results are buffered and written once per phase
+_log = []
+
+def log(message):
+    """Queue a line of launcher output"""
+    _log.append(message)
+
+def flush_log():
+    """Write the queued output in a single call"""
+    if _log:
+        print("\n".join(_log), flush=True)
+        _log.clear()
+
+# A successful check is remembered per interpreter for a day
+LAUNCH_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".devyan_launch_cache.json")
+LAUNCH_CACHE_TTL = 24 * 60 * 60
+
 def check_python_version():
     """Check if Python version is 3.8 or higher"""
-    if sys.version_info < (3, 8):
-        print("❌ Error: Python 3.8 or higher is required")
-        print(f"   Current version: {sys.version}")
+    if sys.hexversion < 0x03080000:
+        log("❌ Error: Python 3.8 or higher is required")
+        log(f"   Current version: {sys.version}")
         return False
-    print(f"✅ Python {sys.version.split()[0]} - OK")
+    log(f"✅ Python {sys.version.split()[0]} - OK")
     return True
 
 def check_package(package_name, import_name=None):
@@ -31,8 +55,67 @@ def check_package(package_name, import_name=None):
         return False
     return True
 
+def _pip_in_process(args):
+    """Run pip inside this interpreter and return its exit status"""
+    from pip._internal.cli.main import main as pip_main
+    try:
+        return pip_main(list(args))
+    except SystemExit as e:
+        # Some options (e.g. --version) exit through the option parser
+        return 0 if e.code in (None, 0) else 1
+
+def run_pip(args):
+    """Run a pip command, in-process when possible, and report success"""
+    try:
+        # Saves starting a second interpreter and re-importing pip
+        return _pip_in_process(args) == 0
+    except Exception:
+        # pip internals are not a stable API, so fall back to a subprocess
+        import subprocess
+        return subprocess.call([sys.executable, "-m", "pip", *args]) == 0
+
+def _normalize(name):
+    """Canonical form of a distribution name for comparisons"""
+    return name.strip().lower().replace("_", "-")
+
+def pinned_requirements(packages):
+    """Replace package names with their version-pinned lines from requirements.txt"""
+    pins = {}
+    try:
+        with open("requirements.txt", encoding="utf-8") as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    name = line
+                    for separator in "<>=!~;[ ":
+                        name = name.split(separator, 1)[0]
+                    pins[_normalize(name)] = line
+    except OSError:
+        pass
+    return [pins.get(_normalize(package), package) for package in packages]
+
+def install_missing(packages):
+    """Install only the given packages with a single pip invocation"""
+    print("📦 Installing dependencies...")
+    # Keep the versions devyan_main is written against (e.g. crewai==0.150.0)
+    packages = pinned_requirements(packages)
+    pip_install = ["install", "--prefer-binary"]
+    
+    # Wheels only first, so no dependency is ever compiled from source
+    if run_pip([*pip_install, "--only-binary=:all:", *packages]):
+        print("✅ Dependencies installed successfully (wheels only)")
+        return True
+    print("⚠️ No wheel for every dependency, retrying with source builds allowed")
+    
+    if run_pip([*pip_install, *packages]):
+        print("✅ Dependencies installed successfully")
+        return True
+    print("❌ Failed to install dependencies")
+    return False
+
 def install_requirements():
     """Install requirements from requirements.txt"""
+    import subprocess
     if os.path.exists("requirements.txt"):
         print("📦 Installing dependencies...")
         try:
@@ -48,49 +131,140 @@ def install_requirements():
         print("⚠️ requirements.txt not found")
         return False
 
-def check_ollama():
-    """Check if Ollama is running"""
-    try:
-        import requests
-        response = requests.get("http://localhost:11434/api/version", timeout=5)
-        if response.status_code == 200:
-            print("✅ Ollama server - OK")
-            return True
-        else:
-            print("⚠️ Ollama server responded with error")
-            return False
-    except Exception:
-        print("⚠️ Ollama server not accessible at localhost:11434")
-        print("   Note: Devyan will still run but may have limited functionality")
+def probe_ollama():
+    """Probe the Ollama port quietly, returning ok, down or missing"""
+    # A local server accepts the connection at once, so a short connect
+    # timeout is enough and skips DNS and HTTP entirely
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.3)
+        try:
+            if sock.connect_ex(("127.0.0.1", 11434)) == 0:
+                return "ok"
+        except OSError:
+            pass
+    
+    # The port is checked first since a server may run without the
+    # binary on PATH (e.g. in a container)
+    return "down" if shutil.which("ollama") else "missing"
+
+def check_ollama(status=None):
+    """Check if Ollama is running, reporting an already probed status if given"""
+    if status is None:
+        status = probe_ollama()
+    
+    if status == "ok":
+        log("✅ Ollama server - OK")
+        return True
+    elif status == "missing":
+        log("⚠️ Ollama not installed - skipping (see https://ollama.ai)")
+        log("   Note: Devyan will still run but may have limited functionality")
+        return False
+    else:
+        log("⚠️ Ollama server not accessible at localhost:11434")
+        log("   Note: Devyan will still run but may have limited functionality")
         return False
 
 def check_tkinter():
     """Check if tkinter is available"""
-    try:
-        import tkinter
-        print("✅ Tkinter - OK")
+    # Locate without importing; devyan_main loads Tk itself. The tkinter
+    # package can be present without its _tkinter extension (python3-tk)
+    if check_package("tkinter") and check_package("_tkinter"):
+        log("✅ Tkinter - OK")
         return True
-    except ImportError:
-        print("❌ Tkinter not available")
-        print("   Install with: sudo apt-get install python3-tk (Linux)")
-        print("   Or: brew install python-tk (macOS)")
+    else:
+        log("❌ Tkinter not available")
+        log("   Install with: sudo apt-get install python3-tk (Linux)")
+        log("   Or: brew install python-tk (macOS)")
         return False
 
+def launch_cache_key():
+    """Identify the interpreter the system check was run against"""
+    return [sys.executable, os.path.getmtime(sys.executable), sys.version]
+
+def load_launch_cache():
+    """Check for a recent successful system check of this interpreter"""
+    try:
+        with open(LAUNCH_CACHE, encoding="utf-8") as f:
+            cache = json.load(f)
+        return (cache.get("ok") is True and
+                cache.get("key") == launch_cache_key() and
+                time.time() - cache.get("time", 0) < LAUNCH_CACHE_TTL)
+    except (OSError, ValueError, AttributeError):
+        return False
+
+def save_launch_cache():
+    """Record a successful system check for the next launch"""
+    try:
+        with open(LAUNCH_CACHE, "w", encoding="utf-8") as f:
+            json.dump({"key": launch_cache_key(), "ok": True, "time": time.time()}, f)
+    except OSError:
+        pass
+
+def launch():
+    """Start the main application, replacing the launcher process where possible"""
+    spec = importlib.util.find_spec("devyan_main")
+    if spec is None or not spec.origin:
+        print("❌ Failed to import devyan_main: module not found")
+        print("   Make sure devyan_main.py is in the current directory")
+        sys.exit(1)
+    
+    if os.name == "posix":
+        # exec drops the launcher's modules and pip state from the GUI process;
+        # Windows has no real exec, so it keeps the in-process import
+        sys.stdout.flush()
+        try:
+            os.execv(sys.executable, [sys.executable, spec.origin, *sys.argv[1:]])
+        except OSError:
+            pass
+    
+    try:
+        import devyan_main
+        devyan_main.main()
+    except ImportError as e:
+        print(f"❌ Failed to import devyan_main: {e}")
+        print("   Make sure devyan_main.py is in the current directory")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Error launching Devyan: {e}")
+        sys.exit(1)
+
 def main():
     """Main launch function"""
-    print("🚀 Devyan v0.1.4 System Check")
-    print("=" * 40)
+    # Fast path for repeated launches; sys.argv is scanned directly so
+    # argparse is never imported
+    if "--skip-checks" in sys.argv[1:] or os.environ.get("DEVYAN_SKIP_CHECKS") == "1":
+        launch()
+        return
+    
+    if load_launch_cache():
+        print("✅ System check passed recently - launching Devyan v0.1.4...")
+        launch()
+        return
+    
+    log("🚀 Devyan v0.1.4 System Check")
+    log("=" * 40)
+    
+    # The Ollama probe can wait out its whole timeout, so it runs while
+    # the local checks do; its result is printed in its usual place
+    ollama_result = {}
+    ollama_probe = threading.Thread(
+        target=lambda: ollama_result.setdefault("status", probe_ollama()),
+        daemon=True
+    )
+    ollama_probe.start()
     
     # Check Python version
     if not check_python_version():
+        flush_log()
         sys.exit(1)
     
     # Check tkinter
     if not check_tkinter():
+        flush_log()
         sys.exit(1)
     
     # Check and install dependencies
-    print("\n📋 Checking dependencies...")
+    log("\n📋 Checking dependencies...")
     
     missing_packages = []
     required_packages = [
@@ -101,43 +275,48 @@ def main():
     
     for package_name, import_name in required_packages:
         if check_package(package_name, import_name):
-            print(f"✅ {package_name} - OK")
+            log(f"✅ {package_name} - OK")
         else:
-            print(f"❌ {package_name} - Missing")
+            log(f"❌ {package_name} - Missing")
             missing_packages.append(package_name)
     
     if missing_packages:
-        print(f"\n📦 Installing missing packages: {', '.join(missing_packages)}")
-        if not install_requirements():
-            print("\n❌ Failed to install dependencies. Please run:")
-            print("   pip install -r requirements.txt")
+        log(f"\n📦 Installing missing packages: {', '.join(missing_packages)}")
+        # pip writes its own progress, so everything before it goes out first
+        flush_log()
+        # Fall back to the pinned requirements if the bare names fail to resolve
+        if not install_missing(missing_packages) and not install_requirements():
+            log("\n❌ Failed to install dependencies. Please run:")
+            log("   pip install -r requirements.txt")
+            flush_log()
             sys.exit(1)
+    else:
+        # Nothing to install, so pip is never started
+        log("✅ All dependencies present")
+    flush_log()
     
     # Check Ollama (optional)
-    print("\n🔍 Checking optional services...")
-    check_ollama()
+    log("\n🔍 Checking optional services...")
+    ollama_probe.join(timeout=1)
+    check_ollama(ollama_result.get("status", "down"))
+    flush_log()
     
     # Create projects directory if it doesn't exist
-    if not os.path.exists("projects"):
-        os.makedirs("projects")
-        print("✅ Created projects directory")
+    existed = os.path.isdir("projects")
+    os.makedirs("projects", exist_ok=True)
+    if not existed:
+        log("✅ Created projects directory")
+    
+    save_launch_cache()
     
-    print("\n" + "=" * 40)
-    print("🎉 System check complete!")
-    print("🚀 Launching Devyan...")
-    print("=" * 40)
+    log("\n" + "=" * 40)
+    log("🎉 System check complete!")
+    log("🚀 Launching Devyan...")
+    log("=" * 40)
+    flush_log()
     
     # Launch the main application
-    try:
-        import devyan_main
-        devyan_main.main()
-    except ImportError as e:
-        print(f"❌ Failed to import devyan_main: {e}")
-        print("   Make sure devyan_main.py is in the current directory")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error launching Devyan: {e}")
-        sys.exit(1)
+    launch()
 
 if __name__ == "__main__":
     main()
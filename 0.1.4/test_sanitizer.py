@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Checks for the LLM output sanitizers in devyan_main
+"""
+
+import unittest
+
+import devyan_main
+from devyan_main import OutputSanitizer
+
+class TestPythonSanitizer(unittest.TestCase):
+    """Fence and shebang handling for generated Python files"""
+    
+    def sanitize_both(self, content: str):
+        """Sanitize with the line scanner and with the regex fallback"""
+        fused = OutputSanitizer.sanitize_python_code(content)
+        regex = OutputSanitizer._sanitize_python_code_regex(content)
+        return fused, regex
+    
+    def test_plain_fences(self):
+        for result in self.sanitize_both("```python\nprint('hi')\n```"):
+            self.assertEqual(result, "#!/usr/bin/env python3\nprint('hi')")
+    
+    def test_indented_fences(self):
+        content = "  ```python\nimport os\n\nprint(os.sep)\n  ```\n"
+        for result in self.sanitize_both(content):
+            self.assertNotIn("```", result)
+            self.assertTrue(result.startswith("#!/usr/bin/env python3\nimport os"))
+            self.assertTrue(OutputSanitizer.validate_python_syntax(result)[0])
+    
+    def test_chunked_input_matches_whole(self):
+        content = "```python\r\nimport os\r\n\r\n\r\n\r\nprint(os.sep)\r\n```"
+        scanner = devyan_main.PythonLineSanitizer()
+        for start in range(0, len(content), 7):
+            scanner.feed(content[start:start + 7])
+        self.assertEqual(scanner.finish(), OutputSanitizer.sanitize_python_code(content))
+
+class TestMarkdownSanitizer(unittest.TestCase):
+    """Fence handling for generated Markdown files"""
+    
+    def test_keeps_code_examples(self):
+        content = "```markdown\n# Title\n\n```bash\npip install x\n```\n```"
+        result = OutputSanitizer.sanitize_markdown_content(content)
+        self.assertTrue(result.startswith("# Title"))
+        self.assertIn("```bash", result)
+
+if __name__ == "__main__":
+    unittest.main()